@@ -15,12 +15,12 @@ from agents.claims import ClaimsAgent
 from agents.mortgagee import MortgageeCertificateAgent
 from business_hours import (
     format_business_hours_prompt,
+    get_current_time,
     is_lunch_hour,
     is_office_open,
 )
 from constants import HOLD_MESSAGE
 from instruction_templates import (
-    ASSISTANT_DTMF_NOTE,
     ASSISTANT_EDGE_CASES,
     ASSISTANT_IDENTITY,
     ASSISTANT_INSURANCE_TYPE_DETECTION,
@@ -46,21 +46,110 @@ from staff_directory import (
     get_agents_by_name_prefix,
     get_alpha_route_key,
     get_bilingual_agents,
+    get_last_name_route_key,
     get_ring_group,
     is_agent_available,
     is_transferable,
 )
 from utils import (
     format_email_for_speech,
+    last_four_digits,
     log_route_decision,
     mask_name,
     mask_phone,
     safe_mask_name,
-    safe_mask_phone,
 )
 
 logger = logging.getLogger("agent")
 
+# Static prompt body, composed once at import. Each office status gets a
+# prebuilt variant (body + greeting) below; only the hours context, which
+# includes the current minute, is appended per Assistant. Keep anything that
+# varies per call out of this prefix; see _PROMPT_CACHE_KEY in main.py.
+_ASSISTANT_CORE_INSTRUCTIONS = compose_instructions(
+    ASSISTANT_IDENTITY,
+    ASSISTANT_OUTPUT_RULES,
+    ASSISTANT_OFFICE_STATUS_GATE,
+    ASSISTANT_ROUTING_REFERENCE,
+    ASSISTANT_STANDARD_FLOW,
+    ASSISTANT_INSURANCE_TYPE_DETECTION,
+    ASSISTANT_TONE_GUIDANCE,
+    ASSISTANT_SPECIAL_NOTES,
+    ASSISTANT_EDGE_CASES,
+    SECURITY_INSTRUCTIONS_EXTENDED,
+    UNCERTAINTY_HANDLING,
+    CAPABILITY_BOUNDARIES,
+    ASSISTANT_OFFICE_INFO,
+    ASSISTANT_PERSONALITY,
+)
+
+# Status greetings; the office status at construction picks one of these
+_GREETING_LUNCH = """GREETING (SAY THIS FIRST when you start):
+"Thank you for calling Harry Leveen Insurance. I'm Willow, an automated assistant. Our staff is on lunch break right now and we'll be back at 1. How can I help you?"
+You may vary the wording slightly but you MUST mention the lunch break and 1 PM return.
+EXCEPTION: If the caller's first message is DISTRESSING (accident, break-in, theft, fire, claim), SKIP the greeting and respond with empathy FIRST. Then mention the lunch break after showing empathy."""
+
+_GREETING_CLOSED = """GREETING (SAY THIS FIRST when you start):
+"Thanks for calling Harry Leveen Insurance. I'm Willow, an automated assistant. We're closed now, but open weekdays 9 to 5 Eastern. How can I help with your insurance?"
+IMPORTANT: You MUST mention that the office is closed in your first response.
+EXCEPTION: If the caller's first message is DISTRESSING (accident, break-in, theft, fire, claim), SKIP the greeting and respond with empathy FIRST. Example: "Oh no, I'm so sorry to hear that. Are you okay?" Then mention office hours briefly after showing empathy."""
+
+_GREETING_OPEN = """GREETING (SAY THIS FIRST when you start):
+"Thank you for calling Harry Leveen Insurance. I'm Willow, an automated assistant. How can I help you today?"
+You may vary the greeting slightly but keep it warm and professional.
+EXCEPTION: If the caller's first message is DISTRESSING (accident, break-in, theft, fire, claim), SKIP the greeting and respond with empathy FIRST. Example: "Oh no, I'm so sorry to hear that. Are you okay?" """
+
+# Static body plus greeting, composed once per office status. Only the hours
+# context (which carries the current time) is appended per Assistant.
+_INSTRUCTIONS_LUNCH = compose_instructions(
+    _ASSISTANT_CORE_INSTRUCTIONS, _GREETING_LUNCH
+)
+_INSTRUCTIONS_CLOSED = compose_instructions(
+    _ASSISTANT_CORE_INSTRUCTIONS, _GREETING_CLOSED
+)
+_INSTRUCTIONS_OPEN = compose_instructions(_ASSISTANT_CORE_INSTRUCTIONS, _GREETING_OPEN)
+
+_HOURS_LOCATION_RESPONSE = (
+    "Our office hours are Monday through Friday, 9 AM to 5 PM Eastern, "
+    "and we're closed from 12 to 1 for lunch. "
+    "We're located at 7208 West Sand Lake Road, Suite 206, Orlando, Florida 32819. "
+    "Is there anything else I can help you with, or would you like to schedule an appointment?"
+)
+
+# The staff directory is static for the life of the process
+_SALES_AGENT_NAMES = frozenset(
+    staff["name"] for staff in get_agents_by_department("PL-Sales Agent")
+)
+
+# Fixed caller-facing replies, formatted once at import
+_INFO_EMAIL_SPOKEN = format_email_for_speech("Info@HLInsure.com")
+
+_BANK_RESPONSE = (
+    f"All requests must be submitted in writing to {_INFO_EMAIL_SPOKEN} "
+    "No, we don't have a fax number. "
+    "Have a good day. Goodbye."
+)
+
+# Replies to handle_restricted_agent_response, keyed by caller_type
+_RESTRICTED_AGENT_RESPONSES = {
+    "vendor_sales": (
+        f"All vendor and sales inquiries should be submitted by email to {_INFO_EMAIL_SPOKEN}. "
+        "Is there anything else I can help you with?"
+    ),
+    "new_client": (
+        "I'd be happy to connect you with one of our sales agents. "
+        "Is this for business or personal insurance?"
+    ),
+    "existing_client": (
+        "I can connect you with the right team member. "
+        "Is this for business or personal insurance?"
+    ),
+}
+_RESTRICTED_AGENT_CLARIFY_RESPONSE = (
+    "I'm sorry, could you clarify — are you an existing client, "
+    "looking to become a client, or is this a vendor or sales call?"
+)
+
 
 class Assistant(Agent):
     """Main front-desk receptionist agent for Harry Levine Insurance.
@@ -90,11 +179,15 @@ class Assistant(Agent):
             is_after_hours: Explicit after-hours flag for testing. If None, determined
                            from business_hours_context or is_office_open().
         """
+        # Read the clock once so the prompt and the status flags agree even
+        # when the call lands on an opening/closing boundary
+        now = get_current_time() if business_hours_context is None else None
+
         # Generate business hours context at agent initialization
         hours_context = (
             business_hours_context
             if business_hours_context is not None
-            else format_business_hours_prompt()
+            else format_business_hours_prompt(now)
         )
 
         # Determine after-hours and lunch status for on_enter behavior
@@ -106,46 +199,19 @@ class Assistant(Agent):
             self._is_lunch = "OFFICE STATUS: Lunch" in business_hours_context
         else:
             # Use real-time check; lunch and after-hours are mutually exclusive
-            self._is_lunch = is_lunch_hour()
-            self._is_after_hours = not is_office_open() and not self._is_lunch
+            self._is_lunch = is_lunch_hour(now)
+            self._is_after_hours = not is_office_open(now) and not self._is_lunch
 
-        # Determine the greeting instruction based on office status
+        # Pick the static prompt prepared for this office status
         if self._is_lunch:
-            greeting_instruction = """GREETING (SAY THIS FIRST when you start):
-"Thank you for calling Harry Leveen Insurance. I'm Willow, an automated assistant. Our staff is on lunch break right now and we'll be back at 1. How can I help you?"
-You may vary the wording slightly but you MUST mention the lunch break and 1 PM return.
-EXCEPTION: If the caller's first message is DISTRESSING (accident, break-in, theft, fire, claim), SKIP the greeting and respond with empathy FIRST. Then mention the lunch break after showing empathy."""
+            static_instructions = _INSTRUCTIONS_LUNCH
         elif self._is_after_hours:
-            greeting_instruction = """GREETING (SAY THIS FIRST when you start):
-"Thanks for calling Harry Leveen Insurance. I'm Willow, an automated assistant. We're closed now, but open weekdays 9 to 5 Eastern. How can I help with your insurance?"
-IMPORTANT: You MUST mention that the office is closed in your first response.
-EXCEPTION: If the caller's first message is DISTRESSING (accident, break-in, theft, fire, claim), SKIP the greeting and respond with empathy FIRST. Example: "Oh no, I'm so sorry to hear that. Are you okay?" Then mention office hours briefly after showing empathy."""
+            static_instructions = _INSTRUCTIONS_CLOSED
         else:
-            greeting_instruction = """GREETING (SAY THIS FIRST when you start):
-"Thank you for calling Harry Leveen Insurance. I'm Willow, an automated assistant. How can I help you today?"
-You may vary the greeting slightly but keep it warm and professional.
-EXCEPTION: If the caller's first message is DISTRESSING (accident, break-in, theft, fire, claim), SKIP the greeting and respond with empathy FIRST. Example: "Oh no, I'm so sorry to hear that. Are you okay?" """
+            static_instructions = _INSTRUCTIONS_OPEN
 
         super().__init__(
-            instructions=compose_instructions(
-                ASSISTANT_IDENTITY,
-                hours_context,
-                greeting_instruction,
-                ASSISTANT_OUTPUT_RULES,
-                ASSISTANT_OFFICE_STATUS_GATE,
-                ASSISTANT_ROUTING_REFERENCE,
-                ASSISTANT_STANDARD_FLOW,
-                ASSISTANT_DTMF_NOTE,
-                ASSISTANT_INSURANCE_TYPE_DETECTION,
-                ASSISTANT_TONE_GUIDANCE,
-                ASSISTANT_SPECIAL_NOTES,
-                ASSISTANT_EDGE_CASES,
-                SECURITY_INSTRUCTIONS_EXTENDED,
-                UNCERTAINTY_HANDLING,
-                CAPABILITY_BOUNDARIES,
-                ASSISTANT_OFFICE_INFO,
-                ASSISTANT_PERSONALITY,
-            ),
+            instructions=compose_instructions(static_instructions, hours_context),
             tools=[
                 EndCallTool(
                     end_instructions="Thank the caller for calling Harry Leveen Insurance and wish them a good day.",
@@ -184,20 +250,23 @@ EXCEPTION: If the caller's first message is DISTRESSING (accident, break-in, the
             last_name: The caller's last name
             phone_number: The caller's phone number
         """
+        userdata = context.userdata
+        full_name = f"{first_name} {last_name}"
+
         # Store individual name components
-        context.userdata.first_name = first_name
-        context.userdata.last_name = last_name
+        userdata.first_name = first_name
+        userdata.last_name = last_name
         # Maintain full name for backwards compatibility
-        context.userdata.name = f"{first_name} {last_name}"
-        context.userdata.phone_number = phone_number
+        userdata.name = full_name
+        userdata.phone_number = phone_number
 
-        full_name = f"{first_name} {last_name}"
         logger.info(
-            f"Recorded caller info: {mask_name(full_name)}, {mask_phone(phone_number)}"
+            "Recorded caller info: %s, %s",
+            mask_name(full_name),
+            mask_phone(phone_number),
         )
 
-        digits = "".join(filter(str.isdigit, phone_number))
-        last4 = digits[-4:] if len(digits) >= 4 else digits
+        last4 = last_four_digits(phone_number)
         return f"Contact information recorded. Phone ending in {last4}."
 
     @function_tool
@@ -219,7 +288,7 @@ EXCEPTION: If the caller's first message is DISTRESSING (accident, break-in, the
         context.userdata.business_name = business_name
 
         logger.info(
-            f"Business insurance inquiry recorded for: {mask_name(business_name)}"
+            "Business insurance inquiry recorded for: %s", mask_name(business_name)
         )
         return "Business insurance noted."
 
@@ -242,7 +311,7 @@ EXCEPTION: If the caller's first message is DISTRESSING (accident, break-in, the
 
         # Normalize spelled name: extract only letters (handles STT errors like
         # "you are b a n" instead of "U R B A N")
-        normalized = "".join(c.upper() for c in last_name_spelled if c.isalpha())
+        normalized = "".join(filter(str.isalpha, last_name_spelled)).upper()
 
         # If we already have last_name from contact info and normalized spelled
         # version doesn't match first letter, prefer the contact info last_name
@@ -253,9 +322,12 @@ EXCEPTION: If the caller's first message is DISTRESSING (accident, break-in, the
         ):
             # STT likely misheard the spelling - use the last_name we already have
             logger.warning(
-                f"Spelled name mismatch: heard '{mask_name(last_name_spelled)}' -> '{mask_name(normalized) if normalized else 'empty'}', "
-                f"but contact info has last_name='{mask_name(context.userdata.last_name)}'. "
-                f"Using last_name for routing."
+                "Spelled name mismatch: heard '%s' -> '%s', "
+                "but contact info has last_name='%s'. "
+                "Using last_name for routing.",
+                mask_name(last_name_spelled),
+                mask_name(normalized) if normalized else "empty",
+                mask_name(context.userdata.last_name),
             )
             normalized = context.userdata.last_name.upper()
 
@@ -264,7 +336,8 @@ EXCEPTION: If the caller's first message is DISTRESSING (accident, break-in, the
         )
 
         logger.info(
-            f"Personal insurance inquiry recorded, last name: {mask_name(context.userdata.last_name_spelled)}"
+            "Personal insurance inquiry recorded, last name: %s",
+            mask_name(context.userdata.last_name_spelled),
         )
         return "Personal insurance noted. Last name recorded."
 
@@ -295,7 +368,8 @@ EXCEPTION: If the caller's first message is DISTRESSING (accident, break-in, the
         context.userdata.call_intent = CallIntent.CLAIMS
         context.userdata._handoff_speech_delivered = True  # Mark speech as delivered
         logger.info(
-            f"Detected claims request, handing off to ClaimsAgent: {context.userdata.to_safe_log()}"
+            "Detected claims request, handing off to ClaimsAgent: %s",
+            context.userdata.to_safe_log(),
         )
 
         # Log the routing decision
@@ -347,7 +421,8 @@ EXCEPTION: If the caller's first message is DISTRESSING (accident, break-in, the
         """
         context.userdata.call_intent = CallIntent.CERTIFICATES
         logger.info(
-            f"Detected certificate request, handing off to MortgageeCertificateAgent: {context.userdata.to_safe_log()}"
+            "Detected certificate request, handing off to MortgageeCertificateAgent: %s",
+            context.userdata.to_safe_log(),
         )
 
         # Log the routing decision
@@ -394,7 +469,8 @@ EXCEPTION: If the caller's first message is DISTRESSING (accident, break-in, the
         """
         context.userdata.call_intent = CallIntent.MORTGAGEE_LIENHOLDERS
         logger.info(
-            f"Detected mortgagee request, handing off to MortgageeCertificateAgent: {context.userdata.to_safe_log()}"
+            "Detected mortgagee request, handing off to MortgageeCertificateAgent: %s",
+            context.userdata.to_safe_log(),
         )
 
         # Log the routing decision
@@ -449,7 +525,8 @@ EXCEPTION: If the caller's first message is DISTRESSING (accident, break-in, the
         """
         context.userdata.call_intent = CallIntent.BANK_CALLER
         logger.info(
-            f"Bank caller detected, handling directly: {context.userdata.to_safe_log()}"
+            "Bank caller detected, handling directly: %s",
+            context.userdata.to_safe_log(),
         )
 
         # Log the routing decision
@@ -462,13 +539,7 @@ EXCEPTION: If the caller's first message is DISTRESSING (accident, break-in, the
         )
 
         # Speak the response directly to ensure consistent delivery
-        info_email = format_email_for_speech("Info@HLInsure.com")
-        bank_response = (
-            f"All requests must be submitted in writing to {info_email} "
-            "No, we don't have a fax number. "
-            "Have a good day. Goodbye."
-        )
-        await context.session.say(bank_response, allow_interruptions=False)
+        await context.session.say(_BANK_RESPONSE, allow_interruptions=False)
 
         # Return None to signal completion - LLM should stay silent
         # (per LiveKit docs: return None for silent completion)
@@ -495,8 +566,9 @@ EXCEPTION: If the caller's first message is DISTRESSING (accident, break-in, the
             if is_agent_available(agent):
                 context.userdata.additional_notes = "Spanish-speaking caller"
                 logger.info(
-                    f"Routing Spanish speaker to bilingual agent: {agent['name']} "
-                    f"(ext {agent['ext']})"
+                    "Routing Spanish speaker to bilingual agent: %s (ext %s)",
+                    agent["name"],
+                    agent["ext"],
                 )
 
                 # Log the routing decision
@@ -577,7 +649,8 @@ EXCEPTION: If the caller's first message is DISTRESSING (accident, break-in, the
         5. Transfer to the appropriate agent's voicemail
         """
         logger.info(
-            f"Detected after-hours call, handing off to AfterHoursAgent: {context.userdata.to_safe_log()}"
+            "Detected after-hours call, handing off to AfterHoursAgent: %s",
+            context.userdata.to_safe_log(),
         )
 
         # Log the routing decision
@@ -606,13 +679,8 @@ EXCEPTION: If the caller's first message is DISTRESSING (accident, break-in, the
         Returns a contextual response based on whether the office is currently open.
         """
         context.userdata.call_intent = CallIntent.HOURS_LOCATION
-        logger.info(f"Providing hours/location info: {context.userdata.to_safe_log()}")
-        return (
-            "Our office hours are Monday through Friday, 9 AM to 5 PM Eastern, "
-            "and we're closed from 12 to 1 for lunch. "
-            "We're located at 7208 West Sand Lake Road, Suite 206, Orlando, Florida 32819. "
-            "Is there anything else I can help you with, or would you like to schedule an appointment?"
-        )
+        logger.info("Providing hours/location info: %s", context.userdata.to_safe_log())
+        return _HOURS_LOCATION_RESPONSE
 
     @function_tool
     async def offer_appointment(
@@ -631,7 +699,8 @@ EXCEPTION: If the caller's first message is DISTRESSING (accident, break-in, the
         context.userdata.call_intent = CallIntent.SOMETHING_ELSE
         context.userdata.additional_notes = "Appointment scheduling request"
         logger.info(
-            f"Appointment request, transferring to VA ring group: {context.userdata.to_safe_log()}"
+            "Appointment request, transferring to VA ring group: %s",
+            context.userdata.to_safe_log(),
         )
 
         # Log the routing decision
@@ -689,7 +758,9 @@ EXCEPTION: If the caller's first message is DISTRESSING (accident, break-in, the
             matches = get_agents_by_name_prefix(name_stripped)
             if len(matches) > 1:
                 names = " and ".join(m["name"] for m in matches)
-                logger.info(f"Rachel disambiguation forced for '{agent_name}': {names}")
+                logger.info(
+                    "Rachel disambiguation forced for '%s': %s", agent_name, names
+                )
                 return f"We have {names}. Which Rachel would you like to speak with?"
 
         # Look up the agent in staff directory (exact match first)
@@ -701,7 +772,10 @@ EXCEPTION: If the caller's first message is DISTRESSING (accident, break-in, the
             if len(matches) > 1:
                 names = " and ".join(m["name"] for m in matches)
                 logger.info(
-                    f"Ambiguous agent name '{agent_name}' matches {len(matches)} agents: {names}"
+                    "Ambiguous agent name '%s' matches %s agents: %s",
+                    agent_name,
+                    len(matches),
+                    names,
                 )
                 return f"We have {names}. Which one would you like to speak with?"
             elif len(matches) == 1:
@@ -716,7 +790,7 @@ EXCEPTION: If the caller's first message is DISTRESSING (accident, break-in, the
                     f"{agent['name']} is no longer with the agency.",
                 )
                 logger.info(
-                    f"Former employee requested: {agent['name']} (status: {status})"
+                    "Former employee requested: %s (status: %s)", agent["name"], status
                 )
                 return f"{message} Is this for business or personal insurance?"
 
@@ -724,7 +798,8 @@ EXCEPTION: If the caller's first message is DISTRESSING (accident, break-in, the
             if not is_transferable(agent["name"]):
                 # Restricted agents (Jason L., Fred) — ask three-way question
                 logger.info(
-                    f"Restricted transfer requested: {agent['name']} - asking caller type"
+                    "Restricted transfer requested: %s - asking caller type",
+                    agent["name"],
                 )
                 context.userdata.restricted_agent_name = agent["name"]
                 return (
@@ -735,12 +810,15 @@ EXCEPTION: If the caller's first message is DISTRESSING (accident, break-in, the
             # For ALL transferable agents, ask what the call is about
             context.userdata.requested_agent_name = agent["name"]
             logger.info(
-                f"Agent {agent['name']} requested - asking for reason: {context.userdata.to_safe_log()}"
+                "Agent %s requested - asking for reason: %s",
+                agent["name"],
+                context.userdata.to_safe_log(),
             )
             return f"Sure, I can connect you with {agent.get('pronunciation', agent['name'])}. May I ask what this is in reference to?"
         else:
             logger.info(
-                f"Agent not found in directory: {mask_name(agent_name) if agent_name else 'empty'}"
+                "Agent not found in directory: %s",
+                mask_name(agent_name) if agent_name else "empty",
             )
             return "I'm not finding that name in our directory. Could you double-check the name for me?"
 
@@ -760,30 +838,14 @@ EXCEPTION: If the caller's first message is DISTRESSING (accident, break-in, the
         """
         restricted_name = getattr(context.userdata, "restricted_agent_name", "unknown")
         logger.info(
-            f"Restricted agent response for {restricted_name}: caller_type={caller_type}"
+            "Restricted agent response for %s: caller_type=%s",
+            restricted_name,
+            caller_type,
         )
 
-        if caller_type == "vendor_sales":
-            email = format_email_for_speech("Info@HLInsure.com")
-            return (
-                f"All vendor and sales inquiries should be submitted by email to {email}. "
-                "Is there anything else I can help you with?"
-            )
-        elif caller_type == "new_client":
-            return (
-                "I'd be happy to connect you with one of our sales agents. "
-                "Is this for business or personal insurance?"
-            )
-        elif caller_type == "existing_client":
-            return (
-                "I can connect you with the right team member. "
-                "Is this for business or personal insurance?"
-            )
-        else:
-            return (
-                "I'm sorry, could you clarify — are you an existing client, "
-                "looking to become a client, or is this a vendor or sales call?"
-            )
+        return _RESTRICTED_AGENT_RESPONSES.get(
+            caller_type, _RESTRICTED_AGENT_CLARIFY_RESPONSE
+        )
 
     @function_tool
     async def complete_specific_agent_transfer(
@@ -835,14 +897,13 @@ EXCEPTION: If the caller's first message is DISTRESSING (accident, break-in, the
             )
 
         # Check if this is a Sales Agent — special routing logic applies
-        sales_agents = get_agents_by_department("PL-Sales Agent")
-        sales_agent_names = [sa["name"] for sa in sales_agents]
-
-        if agent["name"] in sales_agent_names:
+        if agent["name"] in _SALES_AGENT_NAMES:
             if is_new_business:
                 # Transfer to the originally requested Sales Agent
                 logger.info(
-                    f"Completing transfer to Sales Agent {agent['name']} for new business: {reason}"
+                    "Completing transfer to Sales Agent %s for new business: %s",
+                    agent["name"],
+                    reason,
                 )
                 return await self._initiate_transfer(context, agent, "new quote")
             else:
@@ -859,8 +920,11 @@ EXCEPTION: If the caller's first message is DISTRESSING (accident, break-in, the
                     raise self._no_agent_error(context, "Account Executive redirect")
 
                 logger.info(
-                    f"Redirecting from Sales Agent {requested_agent_name} to Account Executive "
-                    f"{ae_agent['name']} for service request: {reason}"
+                    "Redirecting from Sales Agent %s to Account Executive "
+                    "%s for service request: %s",
+                    requested_agent_name,
+                    ae_agent["name"],
+                    reason,
                 )
 
                 ae_name = ae_agent.get(
@@ -876,7 +940,7 @@ EXCEPTION: If the caller's first message is DISTRESSING (accident, break-in, the
                 )
         else:
             # Non-Sales Agent — transfer directly after logging the reason
-            logger.info(f"Completing transfer to {agent['name']} for: {reason}")
+            logger.info("Completing transfer to %s for: %s", agent["name"], reason)
             return await self._initiate_transfer(
                 context, agent, "specific agent request"
             )
@@ -913,14 +977,12 @@ EXCEPTION: If the caller's first message is DISTRESSING (accident, break-in, the
         )
 
         # Log the transfer attempt with extension info (mask PII)
-        caller_name = context.userdata.name
-        caller_phone = context.userdata.phone_number
-
         logger.info(
-            f"[MOCK TRANSFER] Initiating {transfer_type} transfer to {agent_name} "
-            f"(ext {agent_ext}) for caller: "
-            f"name={safe_mask_name(caller_name)}, "
-            f"phone={safe_mask_phone(caller_phone)}"
+            "[MOCK TRANSFER] Initiating %s transfer to %s (ext %s) for caller: %s",
+            transfer_type,
+            agent_name,
+            agent_ext,
+            context.userdata.to_safe_log(),
         )
 
         # Speak the transfer message and wait for it to finish
@@ -938,6 +1000,10 @@ EXCEPTION: If the caller's first message is DISTRESSING (accident, break-in, the
         #   job_ctx = get_job_context()
         #   await job_ctx.transfer_sip_participant(participant, f"tel:{phone_number}")
         # The session will end automatically after a cold transfer.
+        # Keep the REFER after the say() above: it moves the caller's leg out of
+        # the room, so starting it during playout would cut the message off. If
+        # ring time needs hiding, dial the agent's leg (warm transfer) in a task
+        # started before say() and cancel it if the message is interrupted.
 
         # Return None to signal completion - LLM should stay silent
         # (per LiveKit docs: return None for silent completion)
@@ -965,7 +1031,7 @@ EXCEPTION: If the caller's first message is DISTRESSING (accident, break-in, the
         """
         ring_group = get_ring_group(group_name)
         if not ring_group:
-            logger.warning(f"Ring group not found: {group_name}")
+            logger.warning("Ring group not found: %s", group_name)
             # Still speak the message and stay silent
             await context.session.say(
                 f"I'm connecting you with our team now. {HOLD_MESSAGE}",
@@ -974,14 +1040,13 @@ EXCEPTION: If the caller's first message is DISTRESSING (accident, break-in, the
             return  # Return None implicitly for silent completion
 
         # Log the transfer attempt
-        caller_name = context.userdata.name
-        caller_phone = context.userdata.phone_number
-
         logger.info(
-            f"[MOCK TRANSFER] Initiating {transfer_type} transfer to ring group "
-            f"{ring_group['name']} (extensions: {ring_group['extensions']}) for caller: "
-            f"name={safe_mask_name(caller_name)}, "
-            f"phone={safe_mask_phone(caller_phone)}"
+            "[MOCK TRANSFER] Initiating %s transfer to ring group "
+            "%s (extensions: %s) for caller: %s",
+            transfer_type,
+            ring_group["name"],
+            ring_group["extensions"],
+            context.userdata.to_safe_log(),
         )
 
         # Speak the transfer message and wait for it to finish
@@ -1023,11 +1088,7 @@ EXCEPTION: If the caller's first message is DISTRESSING (accident, break-in, the
             identifier = userdata.business_name
         elif userdata.insurance_type == InsuranceType.PERSONAL:
             department = "PL"
-            route_key = (
-                userdata.last_name_spelled[0].upper()
-                if userdata.last_name_spelled
-                else "A"
-            )
+            route_key = get_last_name_route_key(userdata.last_name_spelled)
             identifier = userdata.last_name_spelled
         else:
             logger.warning("No insurance type set, cannot determine routing")
@@ -1038,16 +1099,24 @@ EXCEPTION: If the caller's first message is DISTRESSING (accident, break-in, the
 
         if agent:
             logger.info(
-                f"Alpha-split routing: identifier={identifier}, "
-                f"key={route_key}, department={department}, "
-                f"is_new_business={is_new_business} -> {agent['name']}"
+                "Alpha-split routing: identifier=%s, "
+                "key=%s, department=%s, "
+                "is_new_business=%s -> %s",
+                identifier,
+                route_key,
+                department,
+                is_new_business,
+                agent["name"],
             )
             # Store the assigned agent for reference
             userdata.assigned_agent = agent["name"]
         else:
             logger.warning(
-                f"No agent found for alpha-split: key={route_key}, "
-                f"department={department}, is_new_business={is_new_business}"
+                "No agent found for alpha-split: key=%s, "
+                "department=%s, is_new_business=%s",
+                route_key,
+                department,
+                is_new_business,
             )
 
         return agent
@@ -1146,7 +1215,7 @@ EXCEPTION: If the caller's first message is DISTRESSING (accident, break-in, the
         agent = self._find_agent_for_transfer(context, is_new_business=False)
 
         if not agent:
-            logger.warning(f"No agent found for {transfer_type} transfer")
+            logger.warning("No agent found for %s transfer", transfer_type)
             raise self._no_agent_error(context, transfer_type)
 
         # Log the routing decision
@@ -1160,7 +1229,10 @@ EXCEPTION: If the caller's first message is DISTRESSING (accident, break-in, the
         )
 
         logger.info(
-            f"Transferring {transfer_type} call to {agent['name']}: {context.userdata.to_safe_log()}"
+            "Transferring %s call to %s: %s",
+            transfer_type,
+            agent["name"],
+            context.userdata.to_safe_log(),
         )
 
         return await self._initiate_transfer(context, agent, transfer_type)
@@ -1241,11 +1313,7 @@ EXCEPTION: If the caller's first message is DISTRESSING (accident, break-in, the
 
         # For Personal Lines new quotes, use fallback-enabled routing
         if userdata.insurance_type == InsuranceType.PERSONAL:
-            route_key = (
-                userdata.last_name_spelled[0].upper()
-                if userdata.last_name_spelled
-                else "A"
-            )
+            route_key = get_last_name_route_key(userdata.last_name_spelled)
 
             agent, fallback_type = find_pl_sales_agent_with_fallback(route_key)
 
@@ -1254,8 +1322,10 @@ EXCEPTION: If the caller's first message is DISTRESSING (accident, break-in, the
 
                 # Log with fallback information
                 logger.info(
-                    f"PL new quote routing: key={route_key}, "
-                    f"fallback_type={fallback_type}, agent={agent['name']}"
+                    "PL new quote routing: key=%s, fallback_type=%s, agent=%s",
+                    route_key,
+                    fallback_type,
+                    agent["name"],
                 )
 
                 # Log the routing decision with fallback context
@@ -1275,19 +1345,22 @@ EXCEPTION: If the caller's first message is DISTRESSING (accident, break-in, the
                 elif fallback_type == "alternate_sales":
                     # Routing to the other sales agent
                     logger.info(
-                        f"Primary PL Sales Agent unavailable, using alternate: {agent['name']}"
+                        "Primary PL Sales Agent unavailable, using alternate: %s",
+                        agent["name"],
                     )
                     return await self._initiate_transfer(context, agent, "new quote")
                 elif fallback_type == "account_executive":
                     # Routing to Account Executive as fallback
                     logger.info(
-                        f"Both PL Sales Agents unavailable, falling back to Account Executive: {agent['name']}"
+                        "Both PL Sales Agents unavailable, falling back to Account Executive: %s",
+                        agent["name"],
                     )
                     return await self._initiate_transfer(context, agent, "new quote")
                 elif fallback_type == "management":
                     # Routing to Management as last resort
                     logger.info(
-                        f"All PL Sales Agents and Account Executives unavailable, falling back to Management: {agent['name']}"
+                        "All PL Sales Agents and Account Executives unavailable, falling back to Management: %s",
+                        agent["name"],
                     )
                     return await self._initiate_transfer(context, agent, "new quote")
             else:
@@ -1320,7 +1393,9 @@ EXCEPTION: If the caller's first message is DISTRESSING (accident, break-in, the
         )
 
         logger.info(
-            f"Transferring new quote call to {agent['name']}: {context.userdata.to_safe_log()}"
+            "Transferring new quote call to %s: %s",
+            agent["name"],
+            context.userdata.to_safe_log(),
         )
 
         return await self._initiate_transfer(context, agent, "new quote")
@@ -1415,7 +1490,8 @@ EXCEPTION: If the caller's first message is DISTRESSING (accident, break-in, the
             )
 
             logger.info(
-                f"Transferring payment call to VA ring group: {context.userdata.to_safe_log()}"
+                "Transferring payment call to VA ring group: %s",
+                context.userdata.to_safe_log(),
             )
             return await self._initiate_ring_group_transfer(context, "VA", "payment")
 
@@ -1441,7 +1517,9 @@ EXCEPTION: If the caller's first message is DISTRESSING (accident, break-in, the
         )
 
         logger.info(
-            f"Transferring payment call to {agent['name']} (fallback): {context.userdata.to_safe_log()}"
+            "Transferring payment call to %s (fallback): %s",
+            agent["name"],
+            context.userdata.to_safe_log(),
         )
 
         return await self._initiate_transfer(context, agent, "payment")
@@ -1501,10 +1579,19 @@ EXCEPTION: If the caller's first message is DISTRESSING (accident, break-in, the
         )
 
         # Log with summary for warm transfer context
-        log_msg = f"Transferring 'something else' call to {agent['name']}"
         if summary:
-            log_msg += f" with summary: {summary}"
-        logger.info(f"{log_msg}: {context.userdata.to_safe_log()}")
+            logger.info(
+                "Transferring 'something else' call to %s with summary: %s: %s",
+                agent["name"],
+                summary,
+                context.userdata.to_safe_log(),
+            )
+        else:
+            logger.info(
+                "Transferring 'something else' call to %s: %s",
+                agent["name"],
+                context.userdata.to_safe_log(),
+            )
 
         # For warm transfer, include context in the message
         return await self._initiate_transfer(context, agent, "other inquiry")
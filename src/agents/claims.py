@@ -15,10 +15,46 @@ from instruction_templates import (
     compose_instructions,
 )
 from models import CallerInfo, CallIntent
-from utils import mask_name, mask_phone, safe_mask_name, safe_mask_phone
+from utils import mask_name, mask_phone
 
 logger = logging.getLogger("agent")
 
+# Claims prompts are composed once at import; the business-hours flag only
+# selects which one an instance uses. The business-hours prompt is a minimal
+# fallback because on_enter() executes that transfer without the LLM.
+_CLAIMS_BUSINESS_HOURS_INSTRUCTIONS = compose_instructions(
+    "You are Willow, handling a claims call during business hours.",
+    "The caller has been connected to handle the claim. Stay silent unless they speak to you.",
+    SECURITY_INSTRUCTIONS,
+)
+
+_CLAIMS_AFTER_HOURS_INSTRUCTIONS = compose_instructions(
+    "You are Willow, helping a caller file a claim after hours.",
+    "GOAL: Explain we're closed but help find their carrier's claims number. The caller already heard empathy from the receptionist - do NOT repeat it.",
+    """TONE:
+- Stay warm, caring, and supportive throughout (the caller had a distressing experience)
+- Keep responses concise but human
+- Even when asking practical questions, maintain a supportive tone""",
+    """FLOW:
+1. Start with ONLY this (no empathy - receptionist already said it):
+   "Our office is closed, but I can help you reach your carrier's 24/7 claims line. Do you know which insurance carrier you're with?"
+
+2. If YES: Use record_carrier_name to look up and provide the number.
+   If NO: "You can find their claims number on your insurance card or policy documents."
+
+3. Only if they ask: Offer callback option using request_callback.
+
+NOTE: Do NOT ask "Are you okay?" - the receptionist already asked this. Jump straight to helping them.""",
+    """CARRIER INFO:
+- We have claims numbers on file for most major carriers — always try the lookup tool first
+- Unknown carrier: Direct them to check their insurance card""",
+    """AVOID:
+- Saying "I'm sorry to hear that" - already said by receptionist
+- Repeating that we're closed
+- Over-explaining the situation""",
+    SECURITY_INSTRUCTIONS,
+)
+
 
 class ClaimsAgent(Agent):
     """Specialized agent for handling insurance claims requests.
@@ -58,41 +94,11 @@ class ClaimsAgent(Agent):
             is_business_hours if is_business_hours is not None else is_office_open()
         )
 
-        if self._is_business_hours:
-            # During business hours, the transfer is executed directly in on_enter()
-            # without LLM involvement. These instructions are minimal fallback.
-            instructions = compose_instructions(
-                "You are Willow, handling a claims call during business hours.",
-                "The caller has been connected to handle the claim. Stay silent unless they speak to you.",
-                SECURITY_INSTRUCTIONS,
-            )
-        else:
-            instructions = compose_instructions(
-                "You are Willow, helping a caller file a claim after hours.",
-                "GOAL: Explain we're closed but help find their carrier's claims number. The caller already heard empathy from the receptionist - do NOT repeat it.",
-                """TONE:
-- Stay warm, caring, and supportive throughout (the caller had a distressing experience)
-- Keep responses concise but human
-- Even when asking practical questions, maintain a supportive tone""",
-                """FLOW:
-1. Start with ONLY this (no empathy - receptionist already said it):
-   "Our office is closed, but I can help you reach your carrier's 24/7 claims line. Do you know which insurance carrier you're with?"
-
-2. If YES: Use record_carrier_name to look up and provide the number.
-   If NO: "You can find their claims number on your insurance card or policy documents."
-
-3. Only if they ask: Offer callback option using request_callback.
-
-NOTE: Do NOT ask "Are you okay?" - the receptionist already asked this. Jump straight to helping them.""",
-                """CARRIER INFO:
-- We have claims numbers on file for most major carriers — always try the lookup tool first
-- Unknown carrier: Direct them to check their insurance card""",
-                """AVOID:
-- Saying "I'm sorry to hear that" - already said by receptionist
-- Repeating that we're closed
-- Over-explaining the situation""",
-                SECURITY_INSTRUCTIONS,
-            )
+        instructions = (
+            _CLAIMS_BUSINESS_HOURS_INSTRUCTIONS
+            if self._is_business_hours
+            else _CLAIMS_AFTER_HOURS_INSTRUCTIONS
+        )
 
         super().__init__(instructions=instructions, chat_ctx=chat_ctx)
 
@@ -142,13 +148,11 @@ NOTE: Do NOT ask "Are you okay?" - the receptionist already asked this. Jump str
         userdata.call_intent = CallIntent.CLAIMS
 
         # Log the transfer attempt
-        caller_name = userdata.name
-        caller_phone = userdata.phone_number
         mode = "silently (speech already delivered)" if silent else "directly"
         logger.info(
-            f"[MOCK TRANSFER] Executing claims transfer {mode}: "
-            f"name={safe_mask_name(caller_name)}, "
-            f"phone={safe_mask_phone(caller_phone)}"
+            "[MOCK TRANSFER] Executing claims transfer %s: %s",
+            mode,
+            userdata.to_safe_log(),
         )
 
         if not silent:
@@ -189,7 +193,7 @@ NOTE: Do NOT ask "Are you okay?" - the receptionist already asked this. Jump str
 
         if claims_number:
             logger.info(
-                f"Claims lookup - Found carrier {carrier_name}: {claims_number}"
+                "Claims lookup - Found carrier %s: %s", carrier_name, claims_number
             )
             return (
                 f"I found it. The claims number for {carrier_name} is {claims_number}. "
@@ -197,7 +201,7 @@ NOTE: Do NOT ask "Are you okay?" - the receptionist already asked this. Jump str
             )
         else:
             safe_name = carrier_name[:50] if carrier_name else "empty"
-            logger.info(f"Claims lookup - Carrier not found: {safe_name}")
+            logger.info("Claims lookup - Carrier not found: %s", safe_name)
             return (
                 f"I'm sorry, I don't have the claims number for {carrier_name} in my system. "
                 f"You should be able to find their 24/7 claims number on your insurance card "
@@ -221,12 +225,9 @@ NOTE: Do NOT ask "Are you okay?" - the receptionist already asked this. Jump str
         context.userdata.call_intent = CallIntent.CLAIMS
 
         # Log the transfer attempt
-        caller_name = context.userdata.name
-        caller_phone = context.userdata.phone_number
         logger.info(
-            f"[MOCK TRANSFER] Transferring claims call (via tool): "
-            f"name={safe_mask_name(caller_name)}, "
-            f"phone={safe_mask_phone(caller_phone)}"
+            "[MOCK TRANSFER] Transferring claims call (via tool): %s",
+            context.userdata.to_safe_log(),
         )
 
         # Speak the transfer message
@@ -271,10 +272,10 @@ NOTE: Do NOT ask "Are you okay?" - the receptionist already asked this. Jump str
             context.userdata.additional_notes = "Claims callback requested"
 
         logger.info(
-            f"Claims callback requested: "
-            f"name={mask_name(caller_name)}, "
-            f"phone={mask_phone(phone_number)}, "
-            f"description={brief_description or 'not provided'}"
+            "Claims callback requested: name=%s, phone=%s, description=%s",
+            mask_name(caller_name),
+            mask_phone(phone_number),
+            brief_description or "not provided",
         )
 
         last4 = phone_number[-4:] if len(phone_number) >= 4 else phone_number
@@ -17,11 +17,46 @@ from models import CallerInfo, CallIntent, InsuranceType
 from staff_directory import (
     find_agent_by_alpha,
     get_alpha_route_key,
+    get_last_name_route_key,
 )
 from utils import format_email_for_speech, mask_name, safe_mask_name
 
 logger = logging.getLogger("agent")
 
+# One static prompt covers both request types; request_type only changes the
+# on_enter() reply, so the instructions can be composed once at import.
+_MORTGAGEE_CERTIFICATE_INSTRUCTIONS = compose_instructions(
+    "You are Willow, helping a caller with a certificate of insurance or mortgagee/lienholder request.",
+    "GOAL: Handle certificate and mortgagee requests efficiently.",
+    """KEY INFORMATION:
+- Certificates are for COMMERCIAL insurance only
+- Certificate requests email: Certificate@hlinsure.com
+- Mortgagee requests email: info@hlinsure.com""",
+    """CERTIFICATE REQUEST FLOW:
+1. First ask: "Is this for a new certificate request, or do you have a question about an existing certificate?"
+2. NEW CERTIFICATE: Use check_certificate_type tool with is_new_certificate=True to provide the email (Certificate@hlinsure.com)
+3. EXISTING CERTIFICATE: Say "No problem, let me get you over to an agent that can help you with that."
+   Then ask "What is the name of the business on the certificate?" and use record_caller_info with insurance_type='business', then transfer using transfer_existing_certificate.""",
+    """MORTGAGEE/LIENHOLDER REQUEST FLOW:
+1. INFORM about email requirement:
+   "Got it. HLI requires all mortgagee requests to be sent in writing to info@hlinsure.com."
+   Use provide_mortgagee_email_info tool.
+
+2. OFFER additional help:
+   "Is there anything else I can help you with today?" """,
+    """RULES:
+- Be helpful and informative
+- Certificates are commercial only - no need to ask business/personal
+- For NEW certificate requests: provide email only
+- For EXISTING certificate questions: transfer to Account Executive
+- Provide email addresses clearly""",
+    SECURITY_INSTRUCTIONS,
+)
+
+# Spoken forms of the request mailboxes, formatted once at import
+_CERTIFICATE_EMAIL_SPOKEN = format_email_for_speech("Certificate@hlinsure.com")
+_INFO_EMAIL_SPOKEN = format_email_for_speech("info@hlinsure.com")
+
 
 class MortgageeCertificateAgent(Agent):
     """Specialized agent for handling certificate of insurance and mortgagee requests.
@@ -55,33 +90,7 @@ class MortgageeCertificateAgent(Agent):
         """
         self._request_type = request_type
         super().__init__(
-            instructions=compose_instructions(
-                "You are Willow, helping a caller with a certificate of insurance or mortgagee/lienholder request.",
-                "GOAL: Handle certificate and mortgagee requests efficiently.",
-                """KEY INFORMATION:
-- Certificates are for COMMERCIAL insurance only
-- Certificate requests email: Certificate@hlinsure.com
-- Mortgagee requests email: info@hlinsure.com""",
-                """CERTIFICATE REQUEST FLOW:
-1. First ask: "Is this for a new certificate request, or do you have a question about an existing certificate?"
-2. NEW CERTIFICATE: Use check_certificate_type tool with is_new_certificate=True to provide the email (Certificate@hlinsure.com)
-3. EXISTING CERTIFICATE: Say "No problem, let me get you over to an agent that can help you with that."
-   Then ask "What is the name of the business on the certificate?" and use record_caller_info with insurance_type='business', then transfer using transfer_existing_certificate.""",
-                """MORTGAGEE/LIENHOLDER REQUEST FLOW:
-1. INFORM about email requirement:
-   "Got it. HLI requires all mortgagee requests to be sent in writing to info@hlinsure.com."
-   Use provide_mortgagee_email_info tool.
-
-2. OFFER additional help:
-   "Is there anything else I can help you with today?" """,
-                """RULES:
-- Be helpful and informative
-- Certificates are commercial only - no need to ask business/personal
-- For NEW certificate requests: provide email only
-- For EXISTING certificate questions: transfer to Account Executive
-- Provide email addresses clearly""",
-                SECURITY_INSTRUCTIONS,
-            ),
+            instructions=_MORTGAGEE_CERTIFICATE_INSTRUCTIONS,
             chat_ctx=chat_ctx,
         )
 
@@ -144,9 +153,8 @@ class MortgageeCertificateAgent(Agent):
 
         if is_new_certificate:
             logger.info("Certificate request - NEW certificate, providing email info")
-            cert_email = format_email_for_speech("Certificate@hlinsure.com")
             return (
-                f"You can email your certificate request to {cert_email} "
+                f"You can email your certificate request to {_CERTIFICATE_EMAIL_SPOKEN} "
                 "Did you know you can also issue your own certificates using the "
                 "Harry Levine Insurance app or through the portal on our website "
                 "at harry levine insurance dot com? "
@@ -179,11 +187,11 @@ class MortgageeCertificateAgent(Agent):
         if insurance_type.lower() == "business":
             context.userdata.insurance_type = InsuranceType.BUSINESS
             context.userdata.business_name = identifier
-            logger.info(f"Certificate - recorded business: {mask_name(identifier)}")
+            logger.info("Certificate - recorded business: %s", mask_name(identifier))
         else:
             context.userdata.insurance_type = InsuranceType.PERSONAL
             context.userdata.last_name_spelled = identifier
-            logger.info(f"Certificate - recorded personal: {mask_name(identifier)}")
+            logger.info("Certificate - recorded personal: %s", mask_name(identifier))
 
         return "Got it. Let me connect you with your Account Executive now."
 
@@ -226,11 +234,7 @@ class MortgageeCertificateAgent(Agent):
             identifier = userdata.business_name
         else:
             department = "PL"
-            route_key = (
-                userdata.last_name_spelled[0].upper()
-                if userdata.last_name_spelled
-                else "A"
-            )
+            route_key = get_last_name_route_key(userdata.last_name_spelled)
             identifier = userdata.last_name_spelled
 
         # Find the Account Executive (existing client, so is_new_business=False)
@@ -238,7 +242,9 @@ class MortgageeCertificateAgent(Agent):
 
         if not agent:
             logger.warning(
-                f"No agent found for certificate transfer: key={route_key}, dept={department}"
+                "No agent found for certificate transfer: key=%s, dept=%s",
+                route_key,
+                department,
             )
             return (
                 "I apologize, but I'm having trouble connecting you right now. "
@@ -249,8 +255,11 @@ class MortgageeCertificateAgent(Agent):
         agent_ext = agent.get("ext", "unknown")
 
         logger.info(
-            f"[MOCK TRANSFER] Certificate transfer to {agent['name']} (ext {agent_ext}) "
-            f"for {department} client: {safe_mask_name(identifier)}"
+            "[MOCK TRANSFER] Certificate transfer to %s (ext %s) for %s client: %s",
+            agent["name"],
+            agent_ext,
+            department,
+            safe_mask_name(identifier),
         )
 
         userdata.assigned_agent = agent["name"]
@@ -270,9 +279,8 @@ class MortgageeCertificateAgent(Agent):
         """
         context.userdata.call_intent = CallIntent.MORTGAGEE_LIENHOLDERS
         logger.info("Mortgagee request - provided email info")
-        info_email = format_email_for_speech("info@hlinsure.com")
         return (
-            f"HLI requires all mortgagee and lienholder requests to be sent in writing. "
-            f"The email address is {info_email} "
+            "HLI requires all mortgagee and lienholder requests to be sent in writing. "
+            f"The email address is {_INFO_EMAIL_SPOKEN} "
             "Would you like me to repeat that, or is there anything else I can help you with today?"
         )
@@ -27,6 +27,7 @@ Download required models::
 
 import asyncio
 import logging
+from functools import cache
 
 from dotenv import load_dotenv
 from livekit import rtc
@@ -56,6 +57,15 @@ logger = logging.getLogger("agent")
 
 load_dotenv(".env.local")
 
+# Provider prompt caching only applies to a byte-identical prompt prefix, so
+# the agent prompts are static module-level constants (see agents/assistant.py
+# and agents/after_hours.py) and anything that varies per call is kept out of
+# them. Every call therefore starts from the same prefix; route all of them to
+# the same provider cache bucket. OpenAI caches prompt prefixes automatically;
+# the key only improves the hit rate by keeping the requests on the same cache
+# shard.
+_PROMPT_CACHE_KEY = "harry-levine-receptionist"
+
 
 # =============================================================================
 # SERVER SETUP
@@ -110,6 +120,26 @@ async def request_fnc(req: JobRequest) -> None:
 server.request_fnc = request_fnc
 
 
+@cache
+def _noise_cancellation_for_kind(
+    kind: rtc.ParticipantKind.ValueType,
+) -> rtc.NoiseCancellationOptions:
+    """Return the noise cancellation options for a participant kind.
+
+    The options are immutable model selections, so one instance per kind is
+    shared by every session instead of being rebuilt on each participant join.
+
+    Args:
+        kind: The LiveKit participant kind (SIP callers get the telephony model).
+
+    Returns:
+        BVCTelephony options for SIP participants, BVC options otherwise.
+    """
+    if kind == rtc.ParticipantKind.PARTICIPANT_KIND_SIP:
+        return noise_cancellation.BVCTelephony()
+    return noise_cancellation.BVC()
+
+
 @server.rtc_session(agent_name="Willow")
 async def my_agent(ctx: JobContext) -> None:
     """Main agent entry point for handling voice sessions.
@@ -135,7 +165,7 @@ async def my_agent(ctx: JobContext) -> None:
     # Register shutdown callback for graceful session termination BEFORE connecting
     # Note: callback must be async (returns coroutine, not None)
     async def on_shutdown(reason: str) -> None:
-        logger.info(f"Session ended: {reason}")
+        logger.info("Session ended: %s", reason)
 
     ctx.add_shutdown_callback(on_shutdown)
 
@@ -162,8 +192,14 @@ async def my_agent(ctx: JobContext) -> None:
         # See all available models at https://docs.livekit.io/agents/models/llm/
         llm=LLMFallbackAdapter(
             [
-                inference.LLM(model="openai/gpt-4.1"),
-                inference.LLM(model="openai/gpt-4.1-mini"),
+                inference.LLM(
+                    model="openai/gpt-4.1",
+                    extra_kwargs={"prompt_cache_key": _PROMPT_CACHE_KEY},
+                ),
+                inference.LLM(
+                    model="openai/gpt-4.1-mini",
+                    extra_kwargs={"prompt_cache_key": _PROMPT_CACHE_KEY},
+                ),
             ]
         ),
         # Text-to-speech (TTS) is your agent's voice, turning the LLM's text into speech that the user can hear
@@ -232,20 +268,20 @@ async def my_agent(ctx: JobContext) -> None:
     @session.on("error")
     def _on_error(ev):
         if ev.recoverable:
-            logger.warning(f"Recoverable session error: {ev.error}")
+            logger.warning("Recoverable session error: %s", ev.error)
         else:
-            logger.error(f"Fatal session error: {ev.error}")
+            logger.error("Fatal session error: %s", ev.error)
 
     @session.on("user_input_transcribed")
     def _on_user_input(ev):
         logger.debug(
-            f"User input: words={len(ev.transcript.split()) if ev.transcript else 0}"
+            "User input: words=%s", len(ev.transcript.split()) if ev.transcript else 0
         )
 
     @session.on("conversation_item_added")
     def _on_conversation_item(ev):
         if ev.item.type == "function_call":
-            logger.info(f"Tool called: {ev.item.name}")
+            logger.info("Tool called: %s", ev.item.name)
 
     # To use a realtime model instead of a voice pipeline, use the following session setup instead.
     # (Note: This is for the OpenAI Realtime API. For other providers, see https://docs.livekit.io/agents/models/realtime/))
@@ -272,10 +308,9 @@ async def my_agent(ctx: JobContext) -> None:
             room=ctx.room,
             room_options=room_io.RoomOptions(
                 audio_input=room_io.AudioInputOptions(
-                    noise_cancellation=lambda params: noise_cancellation.BVCTelephony()
-                    if params.participant.kind
-                    == rtc.ParticipantKind.PARTICIPANT_KIND_SIP
-                    else noise_cancellation.BVC(),
+                    noise_cancellation=lambda params: _noise_cancellation_for_kind(
+                        params.participant.kind
+                    ),
                 ),
             ),
         )
@@ -299,7 +334,7 @@ async def my_agent(ctx: JobContext) -> None:
         # Note: The initial greeting is handled by Assistant.on_enter() which calls
         # session.generate_reply() - this is the proper pattern for agent greetings.
     except Exception as e:
-        logger.exception(f"Session initialization failed: {e}")
+        logger.exception("Session initialization failed: %s", e)
         raise
 
 
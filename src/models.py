@@ -9,6 +9,8 @@ This module contains the core data structures used throughout the agent system:
 from dataclasses import dataclass
 from enum import Enum
 
+from utils import mask_name, mask_phone
+
 
 class InsuranceType(str, Enum):
     """Type of insurance inquiry."""
@@ -277,7 +279,7 @@ class CallerInfo:
         Returns:
             True if both name and phone_number are set, False otherwise.
         """
-        return bool(self.name) and bool(self.phone_number)
+        return bool(self.name and self.phone_number)
 
     def has_insurance_identifier(self) -> bool:
         """Check if caller has provided an insurance identifier.
@@ -288,7 +290,7 @@ class CallerInfo:
         Returns:
             True if business_name or last_name_spelled is set, False otherwise.
         """
-        return bool(self.business_name) or bool(self.last_name_spelled)
+        return bool(self.business_name or self.last_name_spelled)
 
     def to_safe_log(self) -> str:
         """Return a safe string representation for logging with masked PII.
@@ -298,8 +300,6 @@ class CallerInfo:
         Returns:
             A string representation with name and phone masked for safe logging.
         """
-        from utils import mask_name, mask_phone
-
         masked_name = mask_name(self.name) if self.name else None
         masked_phone = mask_phone(self.phone_number) if self.phone_number else None
 
@@ -36,6 +36,8 @@ Routing Rules:
 
 from __future__ import annotations
 
+import re
+import string
 from datetime import datetime
 from typing import TypedDict
 
@@ -282,10 +284,18 @@ STAFF_DIRECTORY: StaffDirectoryConfig = {
 }
 
 
-# Alpha exception prefixes in lowercase for case-insensitive matching
-_ALPHA_EXCEPTION_PREFIXES_LOWER: list[str] = [
-    prefix.lower() for prefix in STAFF_DIRECTORY["alphaExceptionPrefixes"]
-]
+# Alpha exception prefixes compiled into one case-insensitive pattern. Each
+# prefix must be followed by whitespace so names like "Theater Co" still
+# route on their own first letter.
+_ALPHA_EXCEPTION_PREFIX_RE = re.compile(
+    r"(?:"
+    + "|".join(
+        r"\s+".join(re.escape(word) for word in prefix.split())
+        for prefix in STAFF_DIRECTORY["alphaExceptionPrefixes"]
+    )
+    + r")\s+",
+    re.IGNORECASE,
+)
 
 
 def get_alpha_route_key(business_name: str) -> str:
@@ -312,24 +322,33 @@ def get_alpha_route_key(business_name: str) -> str:
     if not business_name or not business_name.strip():
         return "A"  # Default fallback
 
-    name_lower = business_name.lower().strip()
-    words = business_name.strip().split()
+    name = business_name.strip()
+
+    # Skip an exception prefix when another word follows it; a bare prefix
+    # (e.g. just "The") routes on its own first letter
+    match = _ALPHA_EXCEPTION_PREFIX_RE.match(name)
+    if match:
+        name = name[match.end() :]
+
+    return name[0].upper()
 
-    # Check each exception prefix
-    for prefix in _ALPHA_EXCEPTION_PREFIXES_LOWER:
-        if name_lower.startswith(prefix):
-            # Count words in the prefix to skip
-            prefix_word_count = len(prefix.split())
-            if len(words) > prefix_word_count:
-                # Return first letter of the word after the prefix
-                next_word = words[prefix_word_count]
-                if next_word:
-                    return next_word[0].upper()
-            # If no word after prefix or next word is empty, use the prefix's first letter
-            break
 
-    # Default: use first letter of the business name
-    return words[0][0].upper()
+def get_last_name_route_key(last_name: str | None) -> str:
+    """Extract the routing letter from a spelled last name.
+
+    Args:
+        last_name: The caller's last name as spelled, if collected.
+
+    Returns:
+        The uppercase first letter, or "A" when no name is available.
+
+    Examples:
+        >>> get_last_name_route_key("smith")
+        'S'
+        >>> get_last_name_route_key(None)
+        'A'
+    """
+    return (last_name or "A")[:1].upper()
 
 
 def _letter_in_range(letter: str, range_str: str) -> bool:
@@ -355,13 +374,50 @@ def _letter_in_range(letter: str, range_str: str) -> bool:
     return start <= letter_upper <= end
 
 
+# Lookup indexes built from STAFF_DIRECTORY at import. When several staff
+# entries share a key, the first one in directory order wins, so each index
+# returns the same entry a linear scan of the staff list would.
+
+
+# Alpha-split department per (line, is_new_business). CL Account Executives
+# handle both new and existing business.
+_ALPHA_DEPARTMENTS: dict[tuple[str, bool], str] = {
+    ("PL", True): "PL-Sales Agent",
+    ("PL", False): "PL-Account Executive",
+    ("CL", True): "CL-Account Executive",
+    ("CL", False): "CL-Account Executive",
+}
+
+
+def _build_alpha_dispatch() -> dict[tuple[str, str, bool], StaffMember]:
+    """Expand every alpha range into a (letter, line, is_new_business) table."""
+    dispatch: dict[tuple[str, str, bool], StaffMember] = {}
+    for (line, is_new_business), target_department in _ALPHA_DEPARTMENTS.items():
+        for staff in STAFF_DIRECTORY["staff"]:
+            if staff["department"] != target_department:
+                continue
+            assigned = staff.get("assigned", "")
+            for letter in string.ascii_uppercase:
+                key = (letter, line, is_new_business)
+                if key not in dispatch and _letter_in_range(letter, assigned):
+                    dispatch[key] = staff
+    return dispatch
+
+
+# Built once at import; find_agent_by_alpha is a single dict probe
+_ALPHA_DISPATCH: dict[tuple[str, str, bool], StaffMember] = _build_alpha_dispatch()
+
+
 def find_agent_by_alpha(
     letter: str, department: str, is_new_business: bool = False
 ) -> StaffMember | None:
     """Find the appropriate agent based on alpha routing rules.
 
+    Looks the agent up in a table precomputed from the staff directory at
+    import time, so no directory scan happens per call.
+
     Args:
-        letter: The routing letter (uppercase).
+        letter: The routing letter (a single letter, any case).
         department: Either "PL" (Personal Lines) or "CL" (Commercial Lines).
         is_new_business: Whether this is a new business inquiry.
             - For PL: True -> Sales Agents, False -> Account Executives
@@ -386,30 +442,9 @@ def find_agent_by_alpha(
         >>> agent["name"] if agent else None
         'Rayvon'
     """
-    letter_upper = letter.upper()
-    department_upper = department.upper()
-
-    # Determine which department type to search for
-    if department_upper == "PL":
-        # Personal Lines
-        if is_new_business:
-            target_department = "PL-Sales Agent"
-        else:
-            target_department = "PL-Account Executive"
-    elif department_upper == "CL":
-        # Commercial Lines - Account Executives handle both new and existing
-        target_department = "CL-Account Executive"
-    else:
-        return None
-
-    # Search for matching agent
-    for staff in STAFF_DIRECTORY["staff"]:
-        if staff["department"] == target_department:
-            assigned = staff.get("assigned", "")
-            if _letter_in_range(letter_upper, assigned):
-                return staff
-
-    return None
+    return _ALPHA_DISPATCH.get(
+        (letter.upper(), department.upper(), bool(is_new_business))
+    )
 
 
 def is_agent_available(agent: StaffMember) -> bool:
@@ -563,6 +598,32 @@ def get_all_pl_sales_agents() -> list[StaffMember]:
     return get_agents_by_department("PL-Sales Agent")
 
 
+def _build_transferable_names() -> frozenset[str]:
+    """Collect the names of staff who can receive direct AI transfers.
+
+    A staff member qualifies when they are not on the restrictedTransfers list
+    and their transferable field is not explicitly False (it defaults to True).
+    When a name appears more than once, the first entry decides.
+
+    Returns:
+        Frozen set of exact staff names that may be transferred to directly.
+    """
+    restricted = set(STAFF_DIRECTORY["restrictedTransfers"])
+    transferable: set[str] = set()
+    seen: set[str] = set()
+    for staff in STAFF_DIRECTORY["staff"]:
+        name = staff["name"]
+        if name in seen:
+            continue
+        seen.add(name)
+        if name not in restricted and staff.get("transferable", True):
+            transferable.add(name)
+    return frozenset(transferable)
+
+
+_TRANSFERABLE_NAMES: frozenset[str] = _build_transferable_names()
+
+
 def is_transferable(agent_name: str) -> bool:
     """Check if an agent can receive direct AI transfers.
 
@@ -585,21 +646,26 @@ def is_transferable(agent_name: str) -> bool:
         >>> is_transferable("Julie L.")
         True
     """
-    # Check the restricted transfers list first
-    if agent_name in STAFF_DIRECTORY["restrictedTransfers"]:
-        return False
+    # Unknown agents are absent from the set, so they fail closed
+    return agent_name in _TRANSFERABLE_NAMES
+
+
+# Lowercased name keys computed once so name lookups don't re-lower every entry
+_STAFF_NAME_KEYS: list[tuple[StaffMember, str, str]] = [
+    (staff, staff["name"].lower(), staff["name"].split()[0].lower())
+    for staff in STAFF_DIRECTORY["staff"]
+]
+
+
+def _build_staff_by_lower_name() -> dict[str, StaffMember]:
+    """Index staff by lowercased full name for exact, case-insensitive lookups."""
+    by_name: dict[str, StaffMember] = {}
+    for staff, name_lower, _ in _STAFF_NAME_KEYS:
+        by_name.setdefault(name_lower, staff)
+    return by_name
 
-    # Look up the agent and check their transferable field
-    for staff in STAFF_DIRECTORY["staff"]:
-        if staff["name"] == agent_name:
-            # If transferable field is explicitly set, use it
-            if "transferable" in staff:
-                return staff["transferable"]
-            # Default to True if not explicitly set
-            return True
 
-    # If agent not found, fail closed (deny transfer for unknown agents)
-    return False
+_STAFF_BY_LOWER_NAME: dict[str, StaffMember] = _build_staff_by_lower_name()
 
 
 def get_agents_by_name_prefix(name: str) -> list[StaffMember]:
@@ -631,21 +697,19 @@ def get_agents_by_name_prefix(name: str) -> list[StaffMember]:
     seen_names: set[str] = set()
 
     # First pass: exact match
-    for staff in STAFF_DIRECTORY["staff"]:
-        if staff["name"].lower() == name_lower and staff["name"] not in seen_names:
+    for staff, staff_name_lower, _ in _STAFF_NAME_KEYS:
+        if staff_name_lower == name_lower and staff["name"] not in seen_names:
             matches.append(staff)
             seen_names.add(staff["name"])
 
     # Second pass: staff name starts with search term (prefix match)
-    for staff in STAFF_DIRECTORY["staff"]:
-        staff_name_lower = staff["name"].lower()
+    for staff, staff_name_lower, _ in _STAFF_NAME_KEYS:
         if staff_name_lower.startswith(name_lower) and staff["name"] not in seen_names:
             matches.append(staff)
             seen_names.add(staff["name"])
 
     # Third pass: search term starts with staff first name
-    for staff in STAFF_DIRECTORY["staff"]:
-        staff_first_name = staff["name"].split()[0].lower()
+    for staff, _, staff_first_name in _STAFF_NAME_KEYS:
         if name_lower.startswith(staff_first_name) and staff["name"] not in seen_names:
             matches.append(staff)
             seen_names.add(staff["name"])
@@ -656,7 +720,8 @@ def get_agents_by_name_prefix(name: str) -> list[StaffMember]:
 def get_agent_by_name(name: str) -> StaffMember | None:
     """Look up an agent by name with prefix matching support.
 
-    Delegates to get_agents_by_name_prefix and returns the first match,
+    Exact (case-insensitive) names are resolved from a prebuilt index. Anything
+    else delegates to get_agents_by_name_prefix and returns the first match,
     preserving the same 3-pass matching priority (exact, prefix, reverse prefix).
 
     Args:
@@ -677,10 +742,30 @@ def get_agent_by_name(name: str) -> StaffMember | None:
         >>> get_agent_by_name("Nonexistent")
         None
     """
+    if not name:
+        return None
+
+    # Exact matches always win, so resolve them from the index without scanning
+    exact = _STAFF_BY_LOWER_NAME.get(name.lower().strip())
+    if exact is not None:
+        return exact
+
     matches = get_agents_by_name_prefix(name)
     return matches[0] if matches else None
 
 
+def _build_staff_by_ext() -> dict[str, StaffMember]:
+    """Index staff by extension number, skipping entries without one."""
+    by_ext: dict[str, StaffMember] = {}
+    for staff in STAFF_DIRECTORY["staff"]:
+        if "ext" in staff:
+            by_ext.setdefault(staff["ext"], staff)
+    return by_ext
+
+
+_STAFF_BY_EXT: dict[str, StaffMember] = _build_staff_by_ext()
+
+
 def get_agent_by_extension(ext: str) -> StaffMember | None:
     """Look up an agent by their extension number.
 
@@ -705,13 +790,7 @@ def get_agent_by_extension(ext: str) -> StaffMember | None:
     if not ext:
         return None
 
-    ext_stripped = ext.strip()
-
-    for staff in STAFF_DIRECTORY["staff"]:
-        if staff.get("ext") == ext_stripped:
-            return staff
-
-    return None
+    return _STAFF_BY_EXT.get(ext.strip())
 
 
 def get_agents_by_department(department: str) -> list[StaffMember]:
@@ -772,6 +851,22 @@ def get_ring_group(group_name: str) -> RingGroup | None:
     return ring_groups.get(group_name)
 
 
+def _build_staff_by_language() -> dict[str, tuple[StaffMember, ...]]:
+    """Group staff members by each language they speak, in directory order.
+
+    Returns:
+        Mapping of language code to the staff members who speak it.
+    """
+    by_language: dict[str, list[StaffMember]] = {}
+    for staff in STAFF_DIRECTORY["staff"]:
+        for language in staff.get("languages", []):
+            by_language.setdefault(language, []).append(staff)
+    return {language: tuple(staff) for language, staff in by_language.items()}
+
+
+_STAFF_BY_LANGUAGE: dict[str, tuple[StaffMember, ...]] = _build_staff_by_language()
+
+
 def get_bilingual_agents(language: str = "es") -> list[StaffMember]:
     """Get all staff members who speak the specified language.
 
@@ -786,8 +881,4 @@ def get_bilingual_agents(language: str = "es") -> list[StaffMember]:
         >>> len(agents) > 0
         True
     """
-    return [
-        staff
-        for staff in STAFF_DIRECTORY["staff"]
-        if language in staff.get("languages", [])
-    ]
+    return list(_STAFF_BY_LANGUAGE.get(language, ()))
@@ -86,9 +86,9 @@ class CollectContactInfoTask(AgentTask[ContactInfoResult]):
 
         full_name = f"{first_name} {last_name}"
         logger.info(
-            f"Contact info collected via task: "
-            f"{mask_name(full_name)}, "
-            f"{mask_phone(phone_number)}"
+            "Contact info collected via task: %s, %s",
+            mask_name(full_name),
+            mask_phone(phone_number),
         )
 
         # Complete the task with the result
@@ -37,7 +37,7 @@ async def collect_phone_number_dtmf(chat_ctx) -> str | None:
         return result.user_input if result else None
     except Exception as e:
         # Beta API - gracefully fall back to speech collection
-        logger.debug(f"GetDtmfTask not available or failed: {e}")
+        logger.debug("GetDtmfTask not available or failed: %s", e)
         return None
 
 
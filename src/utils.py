@@ -62,7 +62,7 @@ def mask_phone(phone: str) -> str:
         >>> mask_phone("123")
         '***'
     """
-    return "***-***-" + phone[-4:] if phone and len(phone) >= 4 else "***"
+    return f"***-***-{phone[-4:]}" if phone and len(phone) >= 4 else "***"
 
 
 def mask_name(name: str) -> str:
@@ -80,7 +80,7 @@ def mask_name(name: str) -> str:
         >>> mask_name("")
         '***'
     """
-    return name[0] + "*" * (len(name) - 1) if name else "***"
+    return name[0].ljust(len(name), "*") if name else "***"
 
 
 def safe_mask_name(name: str | None) -> str:
@@ -154,6 +154,9 @@ def mask_email(email: str | None) -> str:
 # PHONE VALIDATION
 # =============================================================================
 
+# Compiled once at import; the phone helpers run on every recorded phone number
+_NON_DIGIT_RE = re.compile(r"\D")
+
 
 def format_email_for_speech(email: str) -> str:
     """Format email: say naturally first, then spell with comma-separated pauses."""
@@ -194,12 +197,30 @@ def validate_phone(phone: str) -> tuple[bool, str]:
     """
     if not phone:
         return False, ""
-    digits = re.sub(r"[^\d]", "", phone)
+    digits = _NON_DIGIT_RE.sub("", phone)
     if 10 <= len(digits) <= 15:
         return True, digits
     return False, phone
 
 
+def last_four_digits(phone: str) -> str:
+    """Return the last four digits of a phone number, ignoring formatting.
+
+    Args:
+        phone: The phone number as spoken or typed, with any separators.
+
+    Returns:
+        Up to four trailing digits; fewer if the number is shorter.
+
+    Examples:
+        >>> last_four_digits("(555) 123-4567")
+        '4567'
+        >>> last_four_digits("12")
+        '12'
+    """
+    return _NON_DIGIT_RE.sub("", phone)[-4:]
+
+
 # =============================================================================
 # STRUCTURED ROUTE DECISION LOGGING
 # =============================================================================
@@ -257,6 +278,11 @@ def log_route_decision(
     masked_id = mask_name(identifier) if identifier else "None"
 
     logger.info(
-        f"ROUTE_DECISION: intent={intent_str} | agent={agent or 'None'} | "
-        f"insurance_type={type_str} | identifier={masked_id} | destination={destination}"
+        "ROUTE_DECISION: intent=%s | agent=%s | "
+        "insurance_type=%s | identifier=%s | destination=%s",
+        intent_str,
+        agent or "None",
+        type_str,
+        masked_id,
+        destination,
     )
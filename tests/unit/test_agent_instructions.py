@@ -5,6 +5,9 @@ instructions with business hours context injection.
 """
 
 import sys
+from datetime import datetime
+from unittest.mock import patch
+from zoneinfo import ZoneInfo
 
 import pytest
 
@@ -108,6 +111,33 @@ class TestAssistantBusinessHoursContext:
         assert "7:00 AM" in assistant.instructions
         assert "opens at 9 AM" in assistant.instructions
 
+    def test_time_varying_context_comes_after_shared_prefix(self):
+        """Test that calls at different times share the same prompt prefix."""
+        first = Assistant(
+            business_hours_context=(
+                "CURRENT TIME: 10:00 AM ET, Monday\nOFFICE STATUS: Open"
+            )
+        ).instructions
+        second = Assistant(
+            business_hours_context=(
+                "CURRENT TIME: 3:47 PM ET, Friday\nOFFICE STATUS: Open"
+            )
+        ).instructions
+
+        assert first.endswith("OFFICE STATUS: Open")
+        assert first.split("CURRENT TIME:")[0] == second.split("CURRENT TIME:")[0]
+
+    def test_generated_context_and_status_use_same_clock_reading(self):
+        """Test that the prompt and status flags come from a single time check."""
+        lunch = datetime(2024, 1, 8, 12, 30, tzinfo=ZoneInfo("America/New_York"))
+        with patch("agents.assistant.get_current_time", return_value=lunch) as clock:
+            assistant = Assistant()
+
+        clock.assert_called_once()
+        assert assistant._is_lunch is True
+        assert assistant._is_after_hours is False
+        assert "OFFICE STATUS: Lunch" in assistant.instructions
+
 
 @pytest.mark.unit
 class TestAssistantInstructionContent:
@@ -10,6 +10,7 @@ import pytest
 
 sys.path.insert(0, "src")
 from agent import mask_name, mask_phone, validate_phone
+from utils import last_four_digits
 
 
 @pytest.mark.unit
@@ -109,6 +110,27 @@ class TestPhoneValidation:
         assert result == "---()."
 
 
+@pytest.mark.unit
+class TestLastFourDigits:
+    """Tests for extracting the last four digits of a phone number."""
+
+    def test_formatted_number(self):
+        """Test separators are ignored."""
+        assert last_four_digits("+1 (555) 123-4567") == "4567"
+
+    def test_short_number(self):
+        """Test numbers under four digits return what they have."""
+        assert last_four_digits("4-2") == "42"
+
+    def test_no_digits(self):
+        """Test input without digits returns an empty string."""
+        assert last_four_digits("abc-()") == ""
+
+    def test_empty_string(self):
+        """Test empty input returns an empty string."""
+        assert last_four_digits("") == ""
+
+
 @pytest.mark.unit
 class TestMaskPhone:
     """Tests for phone number masking."""
@@ -243,3 +265,48 @@ class TestMaskName:
         assert result[0] == "A"
         assert len(result) == 100
         assert result.count("*") == 99
+
+
+@pytest.mark.unit
+class TestAfterHoursContactPhoneValidation:
+    """Tests for phone validation in the after-hours contact tool."""
+
+    @staticmethod
+    def _context():
+        from unittest.mock import MagicMock
+
+        from models import CallerInfo
+
+        context = MagicMock()
+        context.userdata = CallerInfo()
+        return context
+
+    async def test_incomplete_phone_is_not_recorded(self):
+        """Test that an incomplete number is rejected and nothing is stored."""
+        from agents.after_hours import AfterHoursAgent
+
+        agent = AfterHoursAgent.__new__(AfterHoursAgent)
+        context = self._context()
+
+        result = await agent.record_after_hours_contact(
+            context, "John", "Smith", "555-1234"
+        )
+
+        assert "area code" in result
+        assert context.userdata.phone_number is None
+        assert context.userdata.name is None
+
+    async def test_valid_phone_is_recorded(self):
+        """Test that a complete number is stored as given."""
+        from agents.after_hours import AfterHoursAgent
+
+        agent = AfterHoursAgent.__new__(AfterHoursAgent)
+        context = self._context()
+
+        result = await agent.record_after_hours_contact(
+            context, "John", "Smith", "(407) 555-1234"
+        )
+
+        assert result.startswith("Contact information recorded")
+        assert context.userdata.phone_number == "(407) 555-1234"
+        assert context.userdata.name == "John Smith"
@@ -232,9 +232,10 @@ def test_claims_no_hardcoded_carrier_list():
     """C1: Claims instructions should not contain hardcoded carrier names."""
     import inspect
 
-    from agents.claims import ClaimsAgent
+    import agents.claims as claims_module
 
-    source = inspect.getsource(ClaimsAgent)
+    # Instructions are module-level constants, so inspect the whole module
+    source = inspect.getsource(claims_module)
     assert "Progressive, Travelers, Hartford, Liberty Mutual" not in source, (
         "Claims instructions should not hardcode specific carrier names"
     )
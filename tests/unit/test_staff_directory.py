@@ -16,6 +16,8 @@ from staff_directory import (
     get_agents_by_name_prefix,
     get_alpha_route_key,
     get_available_agent_by_alpha,
+    get_bilingual_agents,
+    get_last_name_route_key,
     get_ring_group,
     is_agent_available,
     is_transferable,
@@ -128,6 +130,13 @@ class TestGetAlphaRouteKey:
         assert get_alpha_route_key("The") == "T"
         assert get_alpha_route_key("Law office of") == "L"
 
+    def test_prefix_must_be_whole_words(self) -> None:
+        """Test names that merely start with prefix letters are not skipped."""
+        assert get_alpha_route_key("Thebes Co") == "T"
+        assert get_alpha_route_key("Theater Company") == "T"
+        assert get_alpha_route_key("The Great Company") == "G"
+        assert get_alpha_route_key("Law  Offices  of Wilson") == "W"
+
     def test_numbers_and_special_characters(self) -> None:
         """Test business names starting with numbers or special chars."""
         assert get_alpha_route_key("123 Industries") == "1"
@@ -139,6 +148,20 @@ class TestGetAlphaRouteKey:
         assert get_alpha_route_key("zephyr industries") == "Z"
 
 
+class TestGetLastNameRouteKey:
+    """Tests for routing key extraction from spelled last names."""
+
+    def test_first_letter_uppercased(self) -> None:
+        """Test that the first letter is returned in uppercase."""
+        assert get_last_name_route_key("smith") == "S"
+        assert get_last_name_route_key("O'BRIEN") == "O"
+
+    def test_missing_name_defaults_to_a(self) -> None:
+        """Test that None or empty names fall back to 'A'."""
+        assert get_last_name_route_key(None) == "A"
+        assert get_last_name_route_key("") == "A"
+
+
 class TestFindAgentByAlpha:
     """Tests for the find_agent_by_alpha function."""
 
@@ -232,6 +255,21 @@ class TestFindAgentByAlpha:
         assert find_agent_by_alpha("A", "XX", is_new_business=True) is None
         assert find_agent_by_alpha("A", "", is_new_business=True) is None
 
+    def test_every_letter_routes_for_each_line(self) -> None:
+        """Test the precomputed table covers A-Z for every line and client type."""
+        for letter in "ABCDEFGHIJKLMNOPQRSTUVWXYZ":
+            for department in ("PL", "CL"):
+                for is_new_business in (True, False):
+                    assert (
+                        find_agent_by_alpha(letter, department, is_new_business)
+                        is not None
+                    ), (letter, department, is_new_business)
+
+    def test_non_letter_returns_none(self) -> None:
+        """Test that digits and symbols do not match any alpha range."""
+        assert find_agent_by_alpha("1", "CL", is_new_business=True) is None
+        assert find_agent_by_alpha("@", "PL", is_new_business=False) is None
+
 
 class TestIsTransferable:
     """Tests for the is_transferable function."""
@@ -315,6 +353,12 @@ class TestGetAgentByName:
         assert agent is not None
         assert agent["name"] == "Adriana"
 
+    def test_every_staff_name_resolves_to_first_prefix_match(self) -> None:
+        """Test the exact-name index agrees with the prefix search order."""
+        for staff in STAFF_DIRECTORY["staff"]:
+            for query in (staff["name"], staff["name"].upper()):
+                assert get_agent_by_name(query) is get_agents_by_name_prefix(query)[0]
+
 
 class TestGetAgentByExtension:
     """Tests for the get_agent_by_extension function."""
@@ -421,6 +465,29 @@ class TestGetAgentsByDepartment:
         assert agents == []
 
 
+class TestGetBilingualAgents:
+    """Tests for the get_bilingual_agents function."""
+
+    def test_matches_directory_order(self) -> None:
+        """Test the result lists every speaker of the language in directory order."""
+        expected = [
+            staff
+            for staff in STAFF_DIRECTORY["staff"]
+            if "es" in staff.get("languages", [])
+        ]
+        assert get_bilingual_agents("es") == expected
+
+    def test_unknown_language(self) -> None:
+        """Test a language nobody speaks returns an empty list."""
+        assert get_bilingual_agents("fr") == []
+
+    def test_result_is_a_fresh_list(self) -> None:
+        """Test mutating a returned list does not affect later lookups."""
+        agents = get_bilingual_agents("es")
+        agents.clear()
+        assert len(get_bilingual_agents("es")) > 0
+
+
 class TestIntegrationScenarios:
     """Integration tests for realistic routing scenarios."""
 